@@ -2,7 +2,8 @@ import streamlit as st
 import pandas as pd
 import numpy as np
 from datetime import datetime
-import time
+
+from player_dna import ALERT_MESSAGES, score_players
 
 # --- 1. GLOBAL VENUE & SOIL DATABASE ---
 # This dictionary contains 'Minute Details' like Soil Geotechnics and Altitude
@@ -29,32 +30,24 @@ class CricketAI:
         swing_prob = max(0, base_swing - altitude_penalty)
         
         # Dew Logic: Night + Humidity > 70%
-        is_night = datetime.now().hour >= 18 or datetime.now().hour <= 4
+        hour = datetime.now().hour
+        is_night = hour >= 18 or hour <= 4
         dew_factor = 0.85 if is_night and humidity > 70 else 0.1
         
-        return {"swing": swing_prob, "spin": spin_index, "dew": dew_factor}
+        return {"swing": float(swing_prob), "spin": float(spin_index), "dew": float(dew_factor)}
 
     @staticmethod
     def player_dna_eval(role, pressure, spin_skill, accel_rating, physics):
-        score = 80
-        alerts = []
-        
-        # CHOKE LOGIC: Low Pressure Resistance + High Dew (Slippery ball)
-        if pressure < 45 and physics['dew'] > 0.7:
-            score -= 25
-            alerts.append("🚩 **CHOKE ALERT:** High failure probability under dew/pressure.")
-            
-        # SPIN-CHOKE: Poor skill vs high surface grip
-        if physics['spin'] > 0.7 and spin_skill < 50:
-            score -= 20
-            alerts.append("🌀 **SPIN TRAP:** Batter likely to be suffocated by spin on this surface.")
-            
-        # ACCELERATION: 
-        if accel_rating > 80:
-            score += 15
-            alerts.append("🚀 **ACCELERATOR:** Elite ability to shift gears in death overs.")
-            
-        return max(0, min(100, score)), alerts
+        # Single-player entry point over the batched scoring kernel
+        scores, flags = score_players(
+            np.array([pressure], dtype=np.float64),
+            np.array([spin_skill], dtype=np.float64),
+            np.array([accel_rating], dtype=np.float64),
+            physics['spin'],
+            physics['dew'],
+        )
+        alerts = [msg for bit, msg in ALERT_MESSAGES.items() if flags[0] & bit]
+        return int(scores[0]), alerts
 
 # --- 3. THE PROFESSIONAL UI ---
 st.set_page_config(page_title="AI Cricket Strategy Suite", layout="wide")
@@ -100,7 +93,6 @@ p_accel = col_c.slider("Acceleration Power", 0, 100, 60)
 
 if st.button("RUN TACTICAL SIMULATION"):
     with st.spinner('Processing physics and behavioral DNA...'):
-        time.sleep(1) # Simulated processing
         score, reports = ai.player_dna_eval(p_role, p_press, p_spin, p_accel, physics)
         
         st.markdown(f"### AI Strategic Score: `{score}/100`")
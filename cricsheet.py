@@ -0,0 +1,106 @@
+import os
+import shutil
+import tempfile
+import threading
+import time
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+import requests
+import pyarrow as pa
+import pyarrow.csv as pacsv
+import pyarrow.parquet as pq
+
+# Shared Cricsheet loader for the matchup apps. Kept out of the Streamlit scripts so the
+# download/parse pipeline and the on-disk cache live in one place.
+
+URL = "https://cricsheet.org/downloads/t20s_csv.zip"
+
+# Parsed match pool is kept on disk so cold starts skip the download + CSV parse
+CACHE_PATH = Path.home() / ".cache" / "cricsheet_t20s.parquet"
+CACHE_TTL = 7 * 24 * 3600  # refresh weekly
+MAX_FILES = 150  # first N match files: a robust sample size
+
+# Only these ball-by-ball columns are used downstream; narrow numerics keep the pool small
+COLS = ['striker', 'bowler', 'runs_off_bat', 'wicket_type', 'ball']
+COL_TYPES = {
+    'striker': pa.string(),
+    'bowler': pa.string(),
+    'runs_off_bat': pa.int8(),
+    'wicket_type': pa.string(),
+    'ball': pa.float32(),
+}
+
+def download_matches(max_files):
+    # Stream the zip into a spooled file (RAM up to 64 MB, then disk) rather than holding r.content
+    with requests.get(URL, stream=True) as r, tempfile.SpooledTemporaryFile(max_size=64 << 20) as tmp:
+        r.raise_for_status()
+        r.raw.decode_content = True # Undo any Content-Encoding so tmp holds the actual zip
+        shutil.copyfileobj(r.raw, tmp)
+        tmp.seek(0)
+        z = zipfile.ZipFile(tmp)
+        # Project only the columns the apps use; files missing any of them raise and get skipped
+        opts = pacsv.ConvertOptions(
+            include_columns=COLS,
+            column_types=COL_TYPES,
+            strings_can_be_null=True,  # empty wicket_type cells -> null, like pd.read_csv
+        )
+        # ONLY read match files, ignore README and info files
+        match_files = [n for n in z.namelist() if n.endswith('.csv') and not n.endswith('_info.csv') and 'README' not in n][:max_files]
+
+        workers = os.cpu_count() or 4
+        # Caps how many decompressed CSVs are held at once; a slot frees when its parse finishes
+        in_flight = threading.BoundedSemaphore(2 * workers)
+
+        def parse_match(member):
+            try:
+                return pacsv.read_csv(pa.BufferReader(member), convert_options=opts)
+            except Exception:
+                return None # Skip malformed files
+            finally:
+                in_flight.release()
+
+        # ZipFile handles aren't thread-safe, so members are read here and handed to the pool as they
+        # come out; Arrow's CSV reader releases the GIL, so parsing overlaps the next reads
+        futures = []
+        with ThreadPoolExecutor(max_workers=workers) as ex:
+            for name in match_files:
+                in_flight.acquire()
+                try:
+                    member = z.read(name)
+                except Exception:
+                    in_flight.release()
+                    continue # Skip corrupted files
+                futures.append(ex.submit(parse_match, member))
+    tables = [t for t in (fut.result() for fut in futures) if t is not None]
+    # Every file shares the COL_TYPES schema, so this is a zero-copy chunk concat with no promotion
+    return pa.concat_tables(tables)
+
+def read_cache(cache_path, max_files):
+    # Only a fresh, fully readable cache of the same sample counts; anything else means re-download
+    try:
+        if time.time() - cache_path.stat().st_mtime >= CACHE_TTL:
+            return None
+        table = pq.read_table(cache_path)
+    except (OSError, pa.ArrowException):
+        return None
+    if (table.schema.metadata or {}).get(b'max_files') != str(max_files).encode():
+        return None
+    return table
+
+def write_cache(table, cache_path, max_files):
+    # Write beside the target and swap it in, so a killed process never leaves a half-written cache
+    tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        pq.write_table(table.replace_schema_metadata({'max_files': str(max_files)}), tmp_path, compression='zstd')
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        tmp_path.unlink(missing_ok=True) # Cache is best-effort (e.g. read-only home)
+
+def load_matches(cache_path=CACHE_PATH, max_files=MAX_FILES):
+    table = read_cache(cache_path, max_files)
+    if table is None:
+        table = download_matches(max_files)
+        write_cache(table, cache_path, max_files)
+    return table
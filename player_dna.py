@@ -0,0 +1,29 @@
+import numpy as np
+from numba import njit
+
+# Batched player scoring kernel. Kept out of the Streamlit script so it is imported (and compiled)
+# once per process rather than rebuilt on every rerun.
+
+# Player alerts are packed as bit flags so a whole squad can be scored in one kernel
+CHOKE_ALERT, SPIN_TRAP, ACCELERATOR = 1, 2, 4
+ALERT_MESSAGES = {
+    CHOKE_ALERT: "🚩 **CHOKE ALERT:** High failure probability under dew/pressure.",
+    SPIN_TRAP: "🌀 **SPIN TRAP:** Batter likely to be suffocated by spin on this surface.",
+    ACCELERATOR: "🚀 **ACCELERATOR:** Elite ability to shift gears in death overs.",
+}
+
+@njit(cache=True)
+def score_players(pressure, spin_skill, accel_rating, spin, dew):
+    # CHOKE LOGIC: Low Pressure Resistance + High Dew (Slippery ball)
+    choke = (pressure < 45) & (dew > 0.7)
+    # SPIN-CHOKE: Poor skill vs high surface grip
+    trap = (spin > 0.7) & (spin_skill < 50)
+    # ACCELERATION:
+    accel = accel_rating > 80
+
+    scores = 80 - np.where(choke, 25, 0) - np.where(trap, 20, 0) + np.where(accel, 15, 0)
+    flags = np.where(choke, CHOKE_ALERT, 0) | np.where(trap, SPIN_TRAP, 0) | np.where(accel, ACCELERATOR, 0)
+    return np.minimum(np.maximum(scores, 0), 100), flags.astype(np.uint8)
+
+# Compile (or load from Numba's disk cache) at import, so no click ever pays for it
+score_players(np.zeros(1), np.zeros(1), np.zeros(1), 0.0, 0.0)
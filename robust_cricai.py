@@ -1,33 +1,59 @@
 import streamlit as st
-import pandas as pd
-import requests
-import zipfile
-import io
+from cricsheet import load_matches
+
+def arrow_to_frame(table):
+    df = table.to_pandas(split_blocks=True, self_destruct=True)
+    # Names repeat millions of times: categoricals store small int codes instead of Python strings
+    for col in ('striker', 'bowler', 'wicket_type'):
+        df[col] = df[col].astype('category')
+    return df
 
 # --- 1. AUTOMATED DATA FETCHING (Cricsheet) ---
-@st.cache_data
+# Cached as a shared resource: no pickle round-trip or output hashing of the full pool per access
+@st.cache_resource(show_spinner=False)
 def get_historical_data():
-    url = "https://cricsheet.org/downloads/t20s_csv.zip"
-    r = requests.get(url)
-    z = zipfile.ZipFile(io.BytesIO(r.content))
+    # Only runs when the pool is (re)built: drop views derived from the previous pool
+    get_player_lists.clear()
+    get_matchup_index.clear()
     # We load the main match data (this is the big data pool)
-    df = pd.concat([pd.read_csv(z.open(f)) for f in z.namelist()[:100] if 'info' not in f])
-    return df
+    return arrow_to_frame(load_matches())
+
+@st.cache_data(ttl=86400, show_spinner=False)
+def get_player_lists():
+    data = get_historical_data()
+    return data['striker'].cat.categories.tolist(), data['bowler'].cat.categories.tolist()
+
+# Read-only and looked up on every report: a shared resource, not a per-call unpickled copy
+@st.cache_resource(show_spinner=False)
+def get_matchup_index():
+    # Aggregate every (striker, bowler) pair once; a report is then a .loc lookup, not a scan
+    data = get_historical_data()
+    runs = data['runs_off_bat']
+    # Named aggregations over precomputed flag columns: one vectorized pass, no per-group lambdas
+    return data.assign(
+        runs=runs.astype('int64'), dots=runs.eq(0), boundaries=runs.isin([4, 6])
+    ).groupby(['striker', 'bowler'], observed=True).agg(
+        balls=('runs', 'size'),
+        runs=('runs', 'sum'),
+        dismissals=('wicket_type', 'count'),  # count() skips the null (not out) rows
+        dots=('dots', 'sum'),
+        boundaries=('boundaries', 'sum'),
+    )
 
 # --- 2. THE MATCHUP BRAIN ---
-def analyze_matchup(df, batsman, bowler):
-    # Filter for specific head-to-head encounters
-    h2h = df[(df['striker'] == batsman) & (df['bowler'] == bowler)]
-    
-    if h2h.empty:
+def analyze_matchup(batsman, bowler):
+    # Look up the pre-aggregated head-to-head encounters
+    try:
+        row = get_matchup_index().loc[(batsman, bowler)]
+    except KeyError:
         return None, "No historical H2H data found. Switching to Skill-Type analysis..."
 
     stats = {
-        "Balls Faced": len(h2h),
-        "Runs Scored": h2h['runs_off_bat'].sum(),
-        "Dismissals": len(h2h[h2h['wicket_type'].notnull()]),
-        "Dots": len(h2h[h2h['runs_off_bat'] == 0]),
-        "Boundaries": len(h2h[h2h['runs_off_bat'].isin([4, 6])])
+        "Balls Faced": row['balls'],
+        "Runs Scored": row['runs'],
+        "Dismissals": row['dismissals'],
+        "Dots": row['dots'],
+        "Boundaries": row['boundaries']
     }
     stats["Strike Rate"] = (stats["Runs Scored"] / stats["Balls Faced"]) * 100
     return stats, "H2H Data Found"
@@ -37,17 +63,19 @@ st.set_page_config(page_title="Matchup AI Pro", layout="wide")
 st.title("🎯 Pro Matchup Intelligence: Batsman vs Bowler")
 
 with st.spinner("Downloading Global Match Data..."):
-    raw_data = get_historical_data()
+    get_historical_data() # Load (and invalidate dependents) before anything derived from the pool
+    all_batsmen, all_bowlers = get_player_lists()
+    get_matchup_index() # Warm the pair index; a no-copy lookup once it is built
 
 # Selection UI
 col1, col2 = st.columns(2)
 with col1:
-    batsman_name = st.selectbox("Select Batsman", sorted(raw_data['striker'].unique()))
+    batsman_name = st.selectbox("Select Batsman", all_batsmen)
 with col2:
-    bowler_name = st.selectbox("Select Bowler", sorted(raw_data['bowler'].unique()))
+    bowler_name = st.selectbox("Select Bowler", all_bowlers)
 
 if st.button("Generate Matchup Report"):
-    stats, msg = analyze_matchup(raw_data, batsman_name, bowler_name)
+    stats, msg = analyze_matchup(batsman_name, bowler_name)
     
     st.subheader(f"⚔️ {batsman_name} vs {bowler_name}")
     st.write(f"Status: {msg}")
@@ -1,36 +1,57 @@
 import streamlit as st
-import pandas as pd
-import requests
-import zipfile
-import io
+import numpy as np
+import polars as pl
 import plotly.express as px
+from cricsheet import load_matches
+
+# Innings phases by over: (0, 6] Powerplay, (6, 15] Middle, (15, 20] Death
+PHASE_EDGES = [6, 15, 20]
+PHASE_LABELS = ['Powerplay', 'Middle', 'Death']
 
 # --- 1. DATA ENGINE (ROBUST & BULLETPROOF) ---
-@st.cache_data
+# Returns the in-memory pool wrapped as a Polars LazyFrame, so each derived query below is
+# planned and run as one Polars expression; cached as a shared resource, so there's no pickle
+# round-trip or hashing per access
+@st.cache_resource(show_spinner="Loading Cricsheet...")
 def get_cleaned_data():
-    url = "https://cricsheet.org/downloads/t20s_csv.zip"
+    # Only runs when the pool is (re)built: drop views derived from the previous pool
+    get_player_lists.clear()
+    get_matchup_index.clear()
+    get_batsman_deliveries.clear()
     try:
-        response = requests.get(url)
-        z = zipfile.ZipFile(io.BytesIO(response.content))
-        
-        match_data_list = []
-        # We process the first 150 files for a robust sample size
-        for filename in z.namelist()[:150]:
-            # ONLY read match files, ignore README and info files
-            if filename.endswith('.csv') and not filename.endswith('_info.csv') and 'README' not in filename:
-                try:
-                    with z.open(filename) as f:
-                        df = pd.read_csv(f)
-                        # Ensure standard columns exist
-                        if 'striker' in df.columns and 'bowler' in df.columns:
-                            match_data_list.append(df)
-                except Exception:
-                    continue # Skip corrupted files
-        
-        return pd.concat(match_data_list, ignore_index=True)
+        # Player names repeat on every ball: categoricals store small int codes instead of strings
+        return pl.from_arrow(load_matches()).lazy().with_columns(
+            pl.col('striker', 'bowler').cast(pl.Categorical)
+        )
     except Exception as e:
         st.error(f"Failed to fetch data: {e}")
-        return pd.DataFrame()
+        return None
+
+@st.cache_data(ttl=86400, show_spinner=False)
+def get_player_lists():
+    players = get_cleaned_data().select(
+        pl.col('striker').unique().cast(pl.String).sort().implode(),
+        pl.col('bowler').unique().cast(pl.String).sort().implode(),
+    ).collect()
+    return players['striker'][0].to_list(), players['bowler'][0].to_list()
+
+# Read-only and looked up on every rerun: a shared resource, not a per-call unpickled copy
+@st.cache_resource(show_spinner=False)
+def get_matchup_index():
+    # Aggregate every (striker, bowler) pair once in Polars; switching bowler is then a dict hit, not a scan
+    pairs = get_cleaned_data().group_by('striker', 'bowler').agg(
+        balls=pl.len(),
+        runs=pl.col('runs_off_bat').cast(pl.Int64).sum(),
+        dismissals=pl.col('wicket_type').count(),
+        dots=(pl.col('runs_off_bat') == 0).sum(),
+    ).collect()
+    return {(striker, bowler): stats for striker, bowler, *stats in pairs.iter_rows()}
+
+@st.cache_data(ttl=86400, max_entries=256, show_spinner=False)
+def get_batsman_deliveries(batsman):
+    # Filter the pool down to one batsman once; bowler changes reuse these small contiguous arrays
+    cols = get_cleaned_data().filter(pl.col('striker') == batsman).select('ball', 'runs_off_bat').collect()
+    return np.ascontiguousarray(cols['ball'].to_numpy()), np.ascontiguousarray(cols['runs_off_bat'].to_numpy())
 
 # --- 2. THE UI & ANALYSIS ---
 st.set_page_config(page_title="Cricket Pro-Matchup AI", layout="wide")
@@ -38,33 +59,34 @@ st.title("🎯 Pro-Scout: Matchup & Phase Intelligence")
 
 data = get_cleaned_data()
 
-if not data.empty:
+if data is not None:
     # Sidebar Filters
     st.sidebar.header("Scouting Filters")
-    all_batsmen = sorted(data['striker'].unique())
-    all_bowlers = sorted(data['bowler'].unique())
+    all_batsmen, all_bowlers = get_player_lists()
     
     batsman = st.sidebar.selectbox("Select Batsman", all_batsmen)
     bowler = st.sidebar.selectbox("Select Bowler", all_bowlers)
     
     # --- CALCULATION LOGIC ---
     # 1. Head-to-Head Data
-    h2h = data[(data['striker'] == batsman) & (data['bowler'] == bowler)]
+    balls, runs, outs, dots = get_matchup_index().get((batsman, bowler), (0, 0, 0, 0))
     
     # 2. General Batsman Stats (for Strengths/Weaknesses)
-    b_stats = data[data['striker'] == batsman]
+    b_overs, b_runs = get_batsman_deliveries(batsman)
+    phase_idx = np.searchsorted(PHASE_EDGES, b_overs, side='left')
+    # Every scouting metric comes off the same runs buffer instead of separate scans
+    b_balls = len(b_runs)
+    b_dots = np.count_nonzero(b_runs == 0)
+    b_boundaries = np.count_nonzero(np.isin(b_runs, [4, 6]))
+    death_runs = b_runs[phase_idx == PHASE_LABELS.index('Death')]
+    death_rpb = death_runs.mean() if len(death_runs) else None
     
     # --- DASHBOARD ---
     col1, col2 = st.columns([1, 1])
     
     with col1:
         st.subheader(f"⚔️ Matchup: {batsman} vs {bowler}")
-        if not h2h.empty:
-            balls = len(h2h)
-            runs = h2h['runs_off_bat'].sum()
-            outs = h2h['wicket_type'].notna().sum()
-            dots = (h2h['runs_off_bat'] == 0).sum()
-            
+        if balls > 0:
             m1, m2, m3 = st.columns(3)
             m1.metric("Strike Rate", round((runs/balls)*100, 1))
             m2.metric("Dismissals", outs)
@@ -75,9 +97,8 @@ if not data.empty:
     with col2:
         st.subheader("🚀 Acceleration Profile")
         # Define Phases
-        b_stats = b_stats.copy()
-        b_stats['phase'] = pd.cut(b_stats['ball'], bins=[0, 6, 15, 20], labels=['Powerplay', 'Middle', 'Death'])
-        phase_performance = b_stats.groupby('phase', observed=False)['runs_off_bat'].sum().reset_index()
+        phase_runs = np.bincount(phase_idx, weights=b_runs, minlength=len(PHASE_LABELS))
+        phase_performance = {'phase': PHASE_LABELS, 'runs_off_bat': phase_runs[:len(PHASE_LABELS)]}
         
         fig = px.bar(phase_performance, x='phase', y='runs_off_bat', color='phase', title="Runs by Match Phase")
         st.plotly_chart(fig, use_container_width=True)
@@ -90,17 +111,16 @@ if not data.empty:
     with col_a:
         st.markdown("### **💪 Strengths**")
         # Logic: High strike rate in specific phases
-        death_sr = b_stats[b_stats['phase'] == 'Death']['runs_off_bat'].mean() * 100
-        if death_sr > 180:
+        if death_rpb is not None and death_rpb * 100 > 180:
             st.success("Elite Death Over Accelerator: High impact in final 5 overs.")
-        st.write(f"- Boundary Frequency: 1 every {round(len(b_stats)/b_stats['runs_off_bat'].isin([4,6]).sum(), 1)} balls")
+        st.write(f"- Boundary Frequency: 1 every {round(b_balls/b_boundaries, 1) if b_boundaries else float('inf')} balls")
 
     with col_b:
         st.markdown("### **⚠️ Weaknesses**")
-        dot_avg = (b_stats['runs_off_bat'] == 0).mean() * 100
+        dot_avg = b_dots / b_balls * 100
         if dot_avg > 40:
             st.error(f"High Dot% ({round(dot_avg, 1)}%): Struggles with strike rotation.")
-        if not h2h.empty and outs > 0:
+        if balls > 0 and outs > 0:
             st.warning(f"Tactical Vulnerability: Has been dismissed by {bowler} {outs} times.")
 
 else: